@@ -3,25 +3,43 @@ Aya Share - Audio to Video Pipeline
 Converts audio recitations into videos with text overlays
 """
 
+from __future__ import annotations
+
 # Standard library imports (organized alphabetically)
+import asyncio
+import functools
+import gc
 import json
+import math
 import os
+import re
+import shutil
+import struct
+import subprocess
 import sys
 import logging
+import tempfile
+import threading
+import time
+import wave
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-
-# Third-party imports
-import requests
-from pydub import AudioSegment, silence
-from moviepy import (
-    ImageClip, 
-    TextClip, 
-    CompositeVideoClip, 
-    concatenate_videoclips, 
-    AudioFileClip, 
-    vfx
-)
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+# Third-party imports are deferred to the functions that use them, so
+# importing this module (or starting a worker process) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    import requests
+    from pydub import AudioSegment
+
+# Optional fast JSON (falls back to the standard library)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging for better debugging and monitoring
 logging.basicConfig(
@@ -45,37 +63,326 @@ DEFAULT_BG_IMAGE = ASSETS_DIR / "bg.png"
 DEFAULT_FONT_FILE = ASSETS_DIR / "TheYearofTheCamel-Regular.otf"
 DEFAULT_AUDIO_FILE = ASSETS_DIR / "quran.mp3"
 
+# FFmpeg binaries (MoviePy honours the same FFMPEG_BINARY variable)
+FFMPEG_BINARY = os.environ.get("FFMPEG_BINARY", "ffmpeg")
+FFPROBE_BINARY = os.environ.get("FFPROBE_BINARY", "ffprobe")
+
+# Number of MoviePy clips rendered per intermediate part file
+MOVIEPY_CLIPS_PER_PART = 50
+
+
+def _save_json(path: str, data: any) -> None:
+    """
+    Write data to a UTF-8 JSON file, keeping Arabic text unescaped.
+    
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _load_json(path: str) -> any:
+    """
+    Read a UTF-8 JSON file.
+    
+    Args:
+        path: Source file path
+    
+    Returns:
+        Parsed data
+    
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            return orjson.loads(f.read())
+    
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket that allows `rate` calls per second on average.
+    """
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _create_session(pool_size: int = 10) -> requests.Session:
+    """
+    Create an HTTP session that keeps connections to the API alive.
+    
+    Transient gateway errors (502/503/504) and failed connects are retried
+    with backoff, which is safe because transcription requests are
+    idempotent. Read timeouts are not retried: the server is already busy
+    with the request, so they fail fast as requests.Timeout.
+    
+    Args:
+        pool_size: Maximum number of pooled connections per host (default: 10)
+    
+    Returns:
+        Configured requests session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=False,
+            status=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=None
+        )
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _wav_duration_ms(path: str) -> Optional[float]:
+    """
+    Read a WAV file's duration from its RIFF header.
+    
+    Args:
+        path: Path to the WAV file
+    
+    Returns:
+        Duration in milliseconds, or None if the header can't be parsed
+        (e.g. a codec the wave module doesn't support)
+    """
+    try:
+        with wave.open(path, "rb") as w:
+            return 1000 * w.getnframes() / w.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+
+def _probe_duration_ms(path: str) -> float:
+    """
+    Read a media file's duration from its header.
+    
+    WAV files (like the chunks split_audio writes) are read with the wave
+    module; anything else, or a WAV it can't parse, goes through ffprobe.
+    
+    Args:
+        path: Path to the media file
+    
+    Returns:
+        Duration in milliseconds
+    """
+    if path.lower().endswith(".wav"):
+        duration_ms = _wav_duration_ms(path)
+        if duration_ms is not None:
+            return duration_ms
+    
+    output = subprocess.check_output(
+        [
+            FFPROBE_BINARY, "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "csv=p=0",
+            path
+        ],
+        text=True
+    )
+    return float(output.strip()) * 1000
+
+
+def _load_chunk_durations(chunks_dir: str) -> Dict[str, float]:
+    """
+    Load chunk durations recorded by split_audio in chunks.json.
+    
+    Args:
+        chunks_dir: Directory containing chunks.json
+    
+    Returns:
+        Mapping of chunk file name to duration in milliseconds (empty if the
+        metadata file is missing or unreadable)
+    """
+    chunks_json_path = os.path.join(chunks_dir, "chunks.json")
+    try:
+        metadata = _load_json(chunks_json_path)
+    except FileNotFoundError:
+        return {}
+    except (IOError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable chunk metadata {chunks_json_path}: {e}")
+        return {}
+    
+    return {os.path.basename(item["file"]): item["duration_ms"] for item in metadata}
+
+
+def _list_chunk_files(chunks_dir: str) -> List[str]:
+    """
+    List the .wav chunks in a directory in chunk order.
+    
+    Names are sorted by their chunk number, so chunk_10.wav comes after
+    chunk_9.wav rather than after chunk_1.wav.
+    
+    Args:
+        chunks_dir: Directory containing chunk_*.wav files
+    
+    Returns:
+        Sorted list of .wav file names
+    """
+    def chunk_key(name: str) -> Tuple[float, str]:
+        match = re.search(r"(\d+)\.wav$", name)
+        return (int(match.group(1)) if match else math.inf, name)
+    
+    return sorted((f for f in os.listdir(chunks_dir) if f.endswith(".wav")), key=chunk_key)
+
+
+def _transcribe_file(
+    session: requests.Session,
+    api_url: str,
+    path: str,
+    timeout: int = 60,
+    duration_ms: Optional[float] = None,
+    rate_limiter: Optional[_RateLimiter] = None
+) -> Dict[str, any]:
+    """
+    Transcribe a single audio chunk using an external API.
+    
+    Args:
+        session: HTTP session used for the request
+        api_url: URL endpoint for the transcription API
+        path: Path to the .wav audio chunk
+        timeout: Request timeout in seconds (default: 60)
+        duration_ms: Known chunk duration; probed from the file header when omitted
+        rate_limiter: Shared limiter to wait on before sending the request
+    
+    Returns:
+        Dictionary containing file path, transcribed text, and duration.
+        Failed requests get empty text and an "error" field so that callers
+        can keep chunk order.
+    """
+    import requests
+    
+    file = os.path.basename(path)
+    
+    if duration_ms is None:
+        duration_ms = _probe_duration_ms(path)
+    
+    try:
+        if rate_limiter:
+            rate_limiter.acquire()
+        
+        # Send audio file to API
+        with open(path, "rb") as f:
+            response = session.post(
+                api_url, 
+                files={"file": f},
+                timeout=timeout
+            )
+        
+        # Check if request was successful
+        response.raise_for_status()
+        
+        # Extract transcription text
+        text = response.json().get("text", "")
+        logger.info(f"  ✓ Transcribed {file}: {text[:50]}{'...' if len(text) > 50 else ''}")
+        
+        return {
+            "file": path,
+            "text": text,
+            "duration_ms": duration_ms
+        }
+        
+    except requests.Timeout:
+        logger.error(f"  ✗ Timeout while transcribing {file}")
+        # Return empty entry to maintain order
+        return {
+            "file": path,
+            "text": "",
+            "duration_ms": duration_ms,
+            "error": "timeout"
+        }
+    except requests.RequestException as e:
+        logger.error(f"  ✗ API error for {file}: {e}")
+        return {
+            "file": path,
+            "text": "",
+            "duration_ms": duration_ms,
+            "error": str(e)
+        }
+    except Exception as e:
+        logger.error(f"  ✗ Unexpected error for {file}: {e}")
+        raise
+
 
 def transcribe_chunks(
     api_url: str, 
     chunks_dir: str, 
     output_json: str,
-    timeout: int = 60
+    timeout: int = 60,
+    concurrency: int = 8,
+    max_rps: float = 5.0
 ) -> List[Dict[str, any]]:
     """
     Transcribe audio chunks using an external API.
     
+    Requests run concurrently on a thread pool, throttled to max_rps so the
+    server is not flooded; results keep the chunk order.
+    
     Args:
         api_url: URL endpoint for the transcription API
         chunks_dir: Directory containing .wav audio chunks
         output_json: Path where transcriptions will be saved
         timeout: Request timeout in seconds (default: 60)
+        concurrency: Maximum number of requests in flight (default: 8)
+        max_rps: Maximum number of requests started per second (default: 5.0)
     
     Returns:
         List of dictionaries containing file path, transcribed text, and duration
     
     Raises:
         FileNotFoundError: If chunks_dir doesn't exist
+        ValueError: If concurrency or max_rps is not positive
         requests.RequestException: If API request fails
     """
     # Validate inputs
     if not os.path.exists(chunks_dir):
         raise FileNotFoundError(f"Chunks directory not found: {chunks_dir}")
+    if concurrency <= 0 or max_rps <= 0:
+        raise ValueError("concurrency and max_rps must be positive")
     
     logger.info(f"Starting transcription from directory: {chunks_dir}")
     
     data = []
-    wav_files = sorted([f for f in os.listdir(chunks_dir) if f.endswith(".wav")])
+    wav_files = _list_chunk_files(chunks_dir)
     
     if not wav_files:
         logger.warning(f"No .wav files found in {chunks_dir}")
@@ -84,62 +391,142 @@ def transcribe_chunks(
     total_files = len(wav_files)
     logger.info(f"Found {total_files} audio chunks to transcribe")
 
-    for idx, file in enumerate(wav_files, start=1):
-        path = os.path.join(chunks_dir, file)
+    durations = _load_chunk_durations(chunks_dir)
+    rate_limiter = _RateLimiter(max_rps)
+    
+    with _create_session(pool_size=concurrency) as session, \
+            ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(
+                _transcribe_file,
+                session,
+                api_url,
+                os.path.join(chunks_dir, file),
+                timeout,
+                durations.get(file),
+                rate_limiter
+            )
+            for file in wav_files
+        ]
         
-        try:
-            logger.info(f"[{idx}/{total_files}] Transcribing {file}...")
-            
-            # Send audio file to API
-            with open(path, "rb") as f:
-                response = requests.post(
-                    api_url, 
-                    files={"file": f},
-                    timeout=timeout
-                )
-            
-            # Check if request was successful
-            response.raise_for_status()
-            
-            # Extract transcription text
-            text = response.json().get("text", "")
-            logger.info(f"  ✓ Transcribed: {text[:50]}{'...' if len(text) > 50 else ''}")
+        # Collect in submission order so transcriptions follow the chunks
+        for idx, (file, future) in enumerate(zip(wav_files, futures), start=1):
+            data.append(future.result())
+            logger.info(f"[{idx}/{total_files}] Done: {file}")
+
+    # Save transcriptions to JSON file
+    try:
+        _save_json(output_json, data)
+        logger.info(f"✓ Saved all transcriptions to {output_json}")
+    except IOError as e:
+        logger.error(f"Failed to save transcriptions: {e}")
+        raise
+    
+    return data
+
+
+def transcribe_chunks_batched(
+    api_url: str,
+    chunks_dir: str,
+    output_json: str,
+    batch_size: int = 16,
+    timeout: int = 60,
+    batch_url: Optional[str] = None
+) -> List[Dict[str, any]]:
+    """
+    Transcribe audio chunks by uploading several files per request.
+    
+    Each batch is posted as a multipart list of "file" fields to the batch
+    endpoint, which must answer with {"texts": [...]} in upload order. Batches
+    that fail fall back to one request per file against api_url.
+    
+    Args:
+        api_url: URL endpoint for single-file transcription
+        chunks_dir: Directory containing .wav audio chunks
+        output_json: Path where transcriptions will be saved
+        batch_size: Number of chunks per request (default: 16)
+        timeout: Request timeout in seconds per file; a batch gets this
+            times its number of files (default: 60)
+        batch_url: Batch endpoint (default: api_url + "_batch")
+    
+    Returns:
+        List of dictionaries containing file path, transcribed text, and duration
+    
+    Raises:
+        FileNotFoundError: If chunks_dir doesn't exist
+        ValueError: If batch_size is not positive
+    """
+    import requests
+    
+    # Validate inputs
+    if not os.path.exists(chunks_dir):
+        raise FileNotFoundError(f"Chunks directory not found: {chunks_dir}")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    
+    batch_url = batch_url or api_url.rstrip("/") + "_batch"
+    logger.info(f"Starting batched transcription from directory: {chunks_dir}")
+    
+    data = []
+    wav_files = _list_chunk_files(chunks_dir)
+    
+    if not wav_files:
+        logger.warning(f"No .wav files found in {chunks_dir}")
+        return data
+    
+    total_batches = -(-len(wav_files) // batch_size)
+    logger.info(f"Found {len(wav_files)} audio chunks to transcribe in {total_batches} batches")
+    
+    durations = _load_chunk_durations(chunks_dir)
+    batch_supported = True
+    with _create_session() as session:
+        for batch_idx, batch_start in enumerate(range(0, len(wav_files), batch_size), start=1):
+            paths = [os.path.join(chunks_dir, f) for f in wav_files[batch_start:batch_start + batch_size]]
+            logger.info(f"[{batch_idx}/{total_batches}] Transcribing {len(paths)} chunks...")
             
-            # Get audio duration
-            duration = AudioSegment.from_file(path).duration_seconds * 1000
+            texts = None
+            if batch_supported:
+                try:
+                    with ExitStack() as stack:
+                        files = [("file", stack.enter_context(open(path, "rb"))) for path in paths]
+                        response = session.post(batch_url, files=files, timeout=timeout * len(paths))
+                    response.raise_for_status()
+                    
+                    texts = response.json().get("texts")
+                    if (
+                        not isinstance(texts, list)
+                        or len(texts) != len(paths)
+                        or not all(isinstance(text, str) for text in texts)
+                    ):
+                        raise ValueError(f"expected {len(paths)} strings in texts, got {texts!r:.100}")
+                except (requests.RequestException, ValueError) as e:
+                    logger.warning(f"  ✗ Batch request failed, falling back to single uploads: {e}")
+                    texts = None
+                    # Stop retrying batches against a server without the endpoint,
+                    # or one too slow to finish a batch in its time budget
+                    if isinstance(e, requests.Timeout) or (
+                        isinstance(e, requests.HTTPError) and e.response.status_code in (404, 405)
+                    ):
+                        batch_supported = False
             
-            # Store results
-            data.append({
-                "file": path,
-                "text": text,
-                "duration_ms": duration
-            })
+            if texts is None:
+                data.extend(
+                    _transcribe_file(session, api_url, path, timeout, durations.get(os.path.basename(path)))
+                    for path in paths
+                )
+                continue
             
-        except requests.Timeout:
-            logger.error(f"  ✗ Timeout while transcribing {file}")
-            # Add empty entry to maintain order
-            data.append({
-                "file": path,
-                "text": "",
-                "duration_ms": AudioSegment.from_file(path).duration_seconds * 1000,
-                "error": "timeout"
-            })
-        except requests.RequestException as e:
-            logger.error(f"  ✗ API error for {file}: {e}")
-            data.append({
-                "file": path,
-                "text": "",
-                "duration_ms": AudioSegment.from_file(path).duration_seconds * 1000,
-                "error": str(e)
-            })
-        except Exception as e:
-            logger.error(f"  ✗ Unexpected error for {file}: {e}")
-            raise
-
+            for path, text in zip(paths, texts):
+                logger.info(f"  ✓ Transcribed {os.path.basename(path)}: {text[:50]}{'...' if len(text) > 50 else ''}")
+                data.append({
+                    "file": path,
+                    "text": text,
+                    "duration_ms": durations.get(os.path.basename(path)) or _probe_duration_ms(path)
+                })
+    
     # Save transcriptions to JSON file
     try:
-        with open(output_json, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        _save_json(output_json, data)
         logger.info(f"✓ Saved all transcriptions to {output_json}")
     except IOError as e:
         logger.error(f"Failed to save transcriptions: {e}")
@@ -148,16 +535,324 @@ def transcribe_chunks(
     return data
 
 
-def split_audio(
+def _decode_with_ffmpeg(audio_path: str) -> AudioSegment:
+    """
+    Decode the first audio stream to 16-bit PCM in a single FFmpeg pass.
+    
+    The stream is read as WAV from a pipe, so the sample rate and channel
+    layout come from its header and no ffprobe call is needed.
+    
+    Args:
+        audio_path: Path to the input audio file
+    
+    Returns:
+        Decoded audio
+    
+    Raises:
+        RuntimeError: If FFmpeg fails or its output has no PCM data
+    """
+    from pydub import AudioSegment
+    
+    cmd = [
+        FFMPEG_BINARY, "-hide_banner", "-loglevel", "error",
+        "-i", audio_path,
+        "-map", "0:a:0",
+        "-c:a", "pcm_s16le",
+        "-f", "wav", "pipe:1"
+    ]
+    
+    with tempfile.TemporaryFile() as ffmpeg_log:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=ffmpeg_log)
+        try:
+            # Sizes in a piped header are placeholders: walk the chunks up to
+            # "data" and take everything after it as samples
+            fmt = raw_data = None
+            riff = process.stdout.read(12)
+            while riff[:4] == b"RIFF" and riff[8:12] == b"WAVE":
+                chunk_header = process.stdout.read(8)
+                if len(chunk_header) < 8:
+                    break
+                chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+                if chunk_id == b"data":
+                    raw_data = process.stdout.read()
+                    break
+                body = process.stdout.read(chunk_size + chunk_size % 2)
+                if chunk_id == b"fmt ":
+                    fmt = struct.unpack_from("<HHI", body)
+        finally:
+            process.stdout.close()
+            returncode = process.wait()
+        
+        if returncode != 0:
+            ffmpeg_log.seek(0)
+            stderr = ffmpeg_log.read().decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"ffmpeg failed with code {returncode}: {stderr[-500:]}")
+    
+    if fmt is None or raw_data is None:
+        raise RuntimeError(f"ffmpeg produced no audio data for {audio_path}")
+    
+    _, channels, frame_rate = fmt
+    trailing = len(raw_data) % (2 * channels)
+    return AudioSegment(
+        data=raw_data[:-trailing] if trailing else raw_data,
+        sample_width=2,
+        frame_rate=frame_rate,
+        channels=channels
+    )
+
+
+def fast_detect_silence(
+    audio_segment: AudioSegment,
+    min_silence_len: int = 1000,
+    silence_thresh: float = -16,
+    seek_step: int = 10
+) -> List[List[int]]:
+    """
+    Vectorized drop-in for pydub's silence.detect_silence.
+    
+    Sums of squared samples are accumulated once at millisecond resolution,
+    so the RMS of every window is a difference of two prefix sums instead of
+    a pass over the window's samples.
+    
+    Args:
+        audio_segment: Audio to scan
+        min_silence_len: Minimum length of silence (milliseconds)
+        silence_thresh: Silence threshold (dBFS)
+        seek_step: Step between window starts (milliseconds)
+    
+    Returns:
+        List of [start_ms, end_ms] silent ranges
+    """
+    import numpy as np
+    
+    seg_len = len(audio_segment)
+    if seg_len < min_silence_len:
+        return []
+    
+    # View the PCM buffer in place (pydub's get_array_of_samples copies it)
+    if audio_segment.sample_width in (2, 4):
+        samples = np.frombuffer(audio_segment.raw_data, dtype=f"<i{audio_segment.sample_width}")
+    else:
+        samples = np.asarray(audio_segment.get_array_of_samples())
+    ms_bounds = np.minimum(
+        np.arange(seg_len + 1, dtype=np.int64) * audio_segment.frame_rate // 1000 * audio_segment.channels,
+        len(samples)
+    )
+    
+    # Prefix sums of squared samples at every millisecond, built a minute at a time
+    csum = np.zeros(seg_len + 1)
+    for block_start in range(0, seg_len, 60_000):
+        block_end = min(block_start + 60_000, seg_len)
+        offset = ms_bounds[block_start]
+        block = np.square(samples[offset:ms_bounds[block_end]], dtype=np.float64)
+        block_csum = np.concatenate(([0.0], np.cumsum(block)))
+        csum[block_start + 1:block_end + 1] = csum[block_start] + block_csum[ms_bounds[block_start + 1:block_end + 1] - offset]
+    
+    last_start = seg_len - min_silence_len
+    starts = np.arange(0, last_start + 1, seek_step)
+    if last_start % seek_step:
+        starts = np.append(starts, last_start)
+    ends = starts + min_silence_len
+    
+    sample_counts = np.maximum(ms_bounds[ends] - ms_bounds[starts], 1)
+    mean_square = (csum[ends] - csum[starts]) / sample_counts
+    thresh_amplitude = 10 ** (silence_thresh / 20) * audio_segment.max_possible_amplitude
+    # pydub compares the integer (truncated) RMS: int(sqrt(ms)) <= t  <=>  ms < (floor(t) + 1) ** 2
+    silent_starts = starts[mean_square < (math.floor(thresh_amplitude) + 1) ** 2]
+    
+    if not silent_starts.size:
+        return []
+    
+    # Windows that overlap belong to the same silent range
+    breaks = np.flatnonzero(np.diff(silent_starts) > min_silence_len)
+    range_starts = silent_starts[np.concatenate(([0], breaks + 1))]
+    range_ends = silent_starts[np.concatenate((breaks, [silent_starts.size - 1]))] + min_silence_len
+    
+    return [[int(start), int(end)] for start, end in zip(range_starts, range_ends)]
+
+
+def _invert_ranges(silences: List[List[float]], total_ms: float) -> List[Tuple[float, float]]:
+    """
+    Turn silent ranges into the non-silent ranges between them.
+    
+    Args:
+        silences: Silent [start_ms, end_ms] ranges in order
+        total_ms: Total audio duration (milliseconds)
+    
+    Returns:
+        List of (start_ms, end_ms) tuples for every non-silent range
+    """
+    nonsilent = []
+    position = 0.0
+    for start, end in silences:
+        if start > position:
+            nonsilent.append((position, float(start)))
+        position = end
+    if position < total_ms:
+        nonsilent.append((position, total_ms))
+    
+    return nonsilent
+
+
+def _pad_ranges(
+    ranges: List[Tuple[float, float]],
+    keep_silence: int,
+    total_ms: float
+) -> List[Tuple[float, float]]:
+    """
+    Pad non-silent ranges with surrounding silence, like pydub's split_on_silence.
+    
+    Overlapping neighbours are split at the midpoint of their overlap.
+    
+    Args:
+        ranges: Non-silent (start_ms, end_ms) ranges in order
+        keep_silence: Amount of silence to keep at the beginning/end of chunks (milliseconds)
+        total_ms: Total audio duration (milliseconds)
+    
+    Returns:
+        List of padded (start_ms, end_ms) tuples clamped to the audio bounds
+    """
+    padded = [[start - keep_silence, end + keep_silence] for start, end in ranges]
+    
+    for current, following in zip(padded, padded[1:]):
+        if following[0] < current[1]:
+            current[1] = (current[1] + following[0]) / 2
+            following[0] = current[1]
+    
+    return [(max(start, 0.0), min(end, total_ms)) for start, end in padded]
+
+
+def _export_wav_chunk(
+    raw_data: bytes,
+    frame_rate: int,
+    sample_width: int,
+    channels: int,
+    out_path: str
+) -> None:
+    """
+    Write raw PCM data to a WAV file (runs in a worker process).
+    
+    Args:
+        raw_data: Interleaved PCM samples
+        frame_rate: Sample rate (Hz)
+        sample_width: Bytes per sample
+        channels: Number of channels
+        out_path: Destination .wav path
+    """
+    from pydub import AudioSegment
+    
+    chunk = AudioSegment(
+        data=raw_data,
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+        channels=channels
+    )
+    chunk.export(out_path, format="wav")
+
+
+def _split_and_export(
+    audio_path: str,
+    output_dir: str,
+    min_silence_len: int,
+    silence_thresh_offset: int,
+    keep_silence: int,
+    seek_step: int
+) -> Iterator[Tuple[str, int]]:
+    """
+    Decode the audio once, find silences with NumPy and export chunks in parallel.
+    
+    FFmpeg only decodes the input to PCM when its binary is available;
+    without it the file is loaded through pydub (WAV only).
+    
+    Yields:
+        (chunk file path, duration in milliseconds) in chunk order as exports finish
+    """
+    from pydub import AudioSegment
+    
+    try:
+        # Load audio file
+        if shutil.which(FFMPEG_BINARY):
+            audio = _decode_with_ffmpeg(audio_path)
+        else:
+            audio = AudioSegment.from_file(audio_path)
+        dbfs = audio.dBFS
+        logger.info(f"Audio loaded: duration={len(audio)/1000:.2f}s, dBFS={dbfs:.2f}")
+    except Exception as e:
+        logger.error(f"Failed to load audio file: {e}")
+        raise
+    
+    # Split audio on silence
+    logger.info("Splitting audio on silence...")
+    try:
+        silences = fast_detect_silence(
+            audio,
+            min_silence_len=min_silence_len,
+            silence_thresh=dbfs - silence_thresh_offset,
+            seek_step=seek_step
+        )
+        chunk_ranges = _pad_ranges(_invert_ranges(silences, len(audio)), keep_silence, len(audio))
+    except Exception as e:
+        logger.error(f"Failed to split audio: {e}")
+        raise
+    
+    if not chunk_ranges:
+        return
+    
+    logger.info(f"Found {len(chunk_ranges)} chunks. Exporting...")
+    
+    # WAV encoding is independent per chunk, so spread it over all cores.
+    # Chunks are sliced only as workers free up, so at most max_in_flight
+    # PCM copies exist next to the decoded audio at any time.
+    max_in_flight = 2 * (os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        pending = deque()
+        
+        def finish_oldest() -> Tuple[str, int]:
+            """Wait for the oldest submitted export and log it."""
+            i, future, out_path, chunk_duration_ms = pending.popleft()
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Failed to export chunk {i}: {e}")
+                raise
+            
+            logger.info(f"  Exported chunk {i+1}/{len(chunk_ranges)}: {chunk_duration_ms/1000:.2f}s")
+            return out_path, chunk_duration_ms
+        
+        for i, (start_ms, end_ms) in enumerate(chunk_ranges):
+            chunk = audio[int(start_ms):int(end_ms)]
+            out_path = os.path.join(output_dir, f"chunk_{i}.wav")
+            future = executor.submit(
+                _export_wav_chunk,
+                chunk.raw_data,
+                chunk.frame_rate,
+                chunk.sample_width,
+                chunk.channels,
+                out_path
+            )
+            pending.append((i, future, out_path, len(chunk)))
+            del chunk
+            
+            if len(pending) >= max_in_flight:
+                yield finish_oldest()
+        
+        while pending:
+            yield finish_oldest()
+
+
+def iter_split_audio(
     audio_path: str, 
     output_dir: str,
     min_silence_len: int = 100,
     silence_thresh_offset: int = 16,
     keep_silence: int = 25,
-    audio_format: str = "mp3"
-) -> List[Dict[str, any]]:
+    seek_step: int = 10
+) -> Iterator[Tuple[str, int]]:
     """
-    Split audio file into chunks based on silence detection.
+    Split audio file into chunks, yielding each chunk as soon as it is written.
+    
+    The audio is decoded once (by FFmpeg when its binary is available),
+    scanned for silence with NumPy and the chunks are written in parallel.
     
     Args:
         audio_path: Path to the input audio file
@@ -165,10 +860,10 @@ def split_audio(
         min_silence_len: Minimum length of silence to be used for a split (milliseconds)
         silence_thresh_offset: Silence threshold relative to average dBFS (higher = more strict)
         keep_silence: Amount of silence to keep at the beginning/end of chunks (milliseconds)
-        audio_format: Format of input audio (default: "mp3")
+        seek_step: Step size of the silence detection window (milliseconds, default: 10)
     
-    Returns:
-        List of dictionaries containing chunk file paths and durations
+    Yields:
+        (chunk file path, duration in milliseconds) in chunk order
     
     Raises:
         FileNotFoundError: If audio file doesn't exist
@@ -178,7 +873,7 @@ def split_audio(
     if not os.path.exists(audio_path):
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
     
-    if min_silence_len <= 0 or silence_thresh_offset <= 0 or keep_silence < 0:
+    if min_silence_len <= 0 or silence_thresh_offset <= 0 or keep_silence < 0 or seek_step <= 0:
         raise ValueError("Silence parameters must be positive values")
     
     logger.info(f"Loading audio from: {audio_path}")
@@ -186,63 +881,70 @@ def split_audio(
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
-    try:
-        # Load audio file
-        audio = AudioSegment.from_file(audio_path)
-        logger.info(f"Audio loaded: duration={len(audio)/1000:.2f}s, dBFS={audio.dBFS:.2f}")
-    except Exception as e:
-        logger.error(f"Failed to load audio file: {e}")
-        raise
+    yield from _split_and_export(
+        audio_path,
+        output_dir,
+        min_silence_len=min_silence_len,
+        silence_thresh_offset=silence_thresh_offset,
+        keep_silence=keep_silence,
+        seek_step=seek_step
+    )
+
+
+def split_audio(
+    audio_path: str, 
+    output_dir: str,
+    min_silence_len: int = 100,
+    silence_thresh_offset: int = 16,
+    keep_silence: int = 25,
+    audio_format: str = "mp3",
+    seek_step: int = 10
+) -> List[Dict[str, any]]:
+    """
+    Split audio file into chunks based on silence detection.
     
-    # Split audio on silence
-    logger.info("Splitting audio on silence...")
-    try:
-        chunks = silence.split_on_silence(
-            audio,
+    Args:
+        audio_path: Path to the input audio file
+        output_dir: Directory where chunks will be saved
+        min_silence_len: Minimum length of silence to be used for a split (milliseconds)
+        silence_thresh_offset: Silence threshold relative to average dBFS (higher = more strict)
+        keep_silence: Amount of silence to keep at the beginning/end of chunks (milliseconds)
+        audio_format: Format of input audio (default: "mp3")
+        seek_step: Step size of the silence detection window (milliseconds, default: 10)
+    
+    Returns:
+        List of dictionaries containing chunk file paths and durations
+    
+    Raises:
+        FileNotFoundError: If audio file doesn't exist
+        ValueError: If parameters are invalid
+    """
+    metadata = [
+        {"file": path, "duration_ms": duration_ms}
+        for path, duration_ms in iter_split_audio(
+            audio_path,
+            output_dir,
             min_silence_len=min_silence_len,
-            silence_thresh=audio.dBFS - silence_thresh_offset,
-            keep_silence=keep_silence
+            silence_thresh_offset=silence_thresh_offset,
+            keep_silence=keep_silence,
+            seek_step=seek_step
         )
-    except Exception as e:
-        logger.error(f"Failed to split audio: {e}")
-        raise
+    ]
     
-    if not chunks:
+    if not metadata:
         logger.warning("No chunks were created. Audio may be too short or has no silence.")
         return []
     
-    logger.info(f"Found {len(chunks)} chunks. Exporting...")
-    
-    metadata = []
-
-    for i, chunk in enumerate(chunks):
-        try:
-            out_path = os.path.join(output_dir, f"chunk_{i}.wav")
-            chunk.export(out_path, format="wav")
-            
-            chunk_duration_ms = len(chunk)
-            metadata.append({
-                "file": out_path,
-                "duration_ms": chunk_duration_ms
-            })
-            
-            logger.info(f"  Exported chunk {i+1}/{len(chunks)}: {chunk_duration_ms/1000:.2f}s")
-            
-        except Exception as e:
-            logger.error(f"Failed to export chunk {i}: {e}")
-            raise
-    
     # Save metadata to JSON
     chunks_json_path = os.path.join(output_dir, "chunks.json")
     try:
-        with open(chunks_json_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        _save_json(chunks_json_path, metadata)
         logger.info(f"✓ Saved metadata to {chunks_json_path}")
     except IOError as e:
         logger.error(f"Failed to save metadata: {e}")
         raise
     
-    logger.info(f"✓ Successfully split audio into {len(chunks)} chunks in {output_dir}/")
+    logger.info(f"✓ Successfully split audio into {len(metadata)} chunks in {output_dir}/")
     
     return metadata
 
@@ -308,8 +1010,7 @@ def generate_video(
     
     # Load transcription data
     try:
-        with open(transcriptions_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = _load_json(transcriptions_path)
     except json.JSONDecodeError as e:
         logger.error(f"Invalid JSON in transcriptions file: {e}")
         raise
@@ -319,94 +1020,513 @@ def generate_video(
     
     logger.info(f"Processing {len(data)} clips for video generation...")
     
-    clips = []
-    skipped_clips = 0
+    render_options = dict(
+        data=data,
+        final_video=final_video,
+        original_audio=original_audio,
+        bg_path=bg_path,
+        font_path=font_path,
+        fade_duration=fade_duration,
+        min_duration_for_fade=min_duration_for_fade,
+        font_size=font_size,
+        text_color=text_color,
+        fps=fps
+    )
     
-    for i, item in enumerate(data, start=1):
-        try:
-            caption_text = item.get("text", "").strip()
-            duration = item.get("duration_ms", 0) / 1000.0
-            
-            # Skip empty or very short clips
-            if not caption_text:
-                logger.warning(f"Clip {i}/{len(data)}: Empty text - skipping")
-                skipped_clips += 1
-                continue
-            
-            if duration <= 0:
-                logger.warning(f"Clip {i}/{len(data)}: Invalid duration - skipping")
-                skipped_clips += 1
+    if _ffmpeg_supports("filters", "ass"):
+        _render_with_ffmpeg(**render_options)
+    else:
+        logger.warning("FFmpeg with libass not available, rendering with MoviePy")
+        _render_with_moviepy(**render_options)
+    
+    return final_video
+
+
+@functools.lru_cache(maxsize=None)
+def _ffmpeg_supports(kind: str, name: str, binary: str = FFMPEG_BINARY) -> bool:
+    """
+    Check whether an FFmpeg binary is installed and built with a component.
+    
+    Args:
+        kind: Component list to search ("filters" or "encoders")
+        name: Component name (e.g. "ass", "h264_nvenc")
+        binary: FFmpeg executable to query
+    
+    Returns:
+        True if the component is available
+    """
+    if not shutil.which(binary):
+        return False
+    
+    result = subprocess.run(
+        [binary, "-hide_banner", f"-{kind}"],
+        capture_output=True, text=True, encoding="utf-8", errors="replace"
+    )
+    return re.search(rf"^\s*\S+\s+{re.escape(name)}\s", result.stdout, re.MULTILINE) is not None
+
+
+def _select_video_encoder(binary: str = FFMPEG_BINARY) -> Tuple[str, List[str]]:
+    """
+    Pick the H.264 encoder for an FFmpeg binary.
+    
+    NVENC is used when an NVIDIA driver is present and the binary was built
+    with it; otherwise libx264 runs with a fast preset on every core.
+    
+    Args:
+        binary: FFmpeg executable that will encode the video
+    
+    Returns:
+        Tuple of (codec name, extra FFmpeg output arguments)
+    """
+    if shutil.which("nvidia-smi") and _ffmpeg_supports("encoders", "h264_nvenc", binary):
+        return "h264_nvenc", ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-cq", "23"]
+    
+    return "libx264", ["-preset", "superfast", "-threads", str(os.cpu_count())]
+
+
+def _ass_timestamp(seconds: float) -> str:
+    """Format seconds as an ASS subtitle timestamp (H:MM:SS.cc)."""
+    centiseconds = round(seconds * 100)
+    hours, centiseconds = divmod(centiseconds, 360000)
+    minutes, centiseconds = divmod(centiseconds, 6000)
+    return f"{hours}:{minutes:02d}:{centiseconds // 100:02d}.{centiseconds % 100:02d}"
+
+
+def _font_postscript_name(font_path: str) -> Optional[str]:
+    """
+    Read the PostScript name (name ID 6) from a TrueType/OpenType font.
+    
+    libass matches fonts on their platform name records, where a family
+    name can differ from the one Pillow reports; the PostScript name is
+    unique to the face and always resolves to the file itself.
+    
+    Args:
+        font_path: Path to a .ttf/.otf file
+    
+    Returns:
+        PostScript name, or None if the font has no readable name table
+    """
+    try:
+        with open(font_path, "rb") as f:
+            data = f.read()
+        num_tables = struct.unpack_from(">H", data, 4)[0]
+        for i in range(num_tables):
+            tag, _, offset, _ = struct.unpack_from(">4sIII", data, 12 + 16 * i)
+            if tag != b"name":
                 continue
             
-            logger.info(f"Clip {i}/{len(data)}: {caption_text[:50]}{'...' if len(caption_text) > 50 else ''} (duration: {duration:.2f}s)")
-            
-            # Create background clip
-            bg_clip = ImageClip(bg_path, duration=duration)
-            
-            # Calculate appropriate fade duration (don't fade more than 1/3 of clip)
-            current_fade_duration = min(fade_duration, duration / 3) if duration > min_duration_for_fade else 0
-            
-            # Create text clip
-            txt_clip = (
-                TextClip(
-                    text=caption_text,
-                    font=font_path,
-                    font_size=font_size,
-                    color=text_color,
-                    size=bg_clip.size,
-                    method="caption",
+            _, count, string_offset = struct.unpack_from(">HHH", data, offset)
+            names = {}
+            for j in range(count):
+                platform_id, _, _, name_id, length, name_offset = struct.unpack_from(
+                    ">HHHHHH", data, offset + 6 + 12 * j
                 )
-                .with_duration(duration)
-                .with_position("center")
-            )
-            
-            # Apply fade effects if duration allows
-            if current_fade_duration > 0:
-                txt_clip = txt_clip.with_effects([
-                    vfx.FadeIn(current_fade_duration),
-                    vfx.FadeOut(current_fade_duration)
-                ])
+                if name_id == 6:
+                    start = offset + string_offset + name_offset
+                    names[platform_id] = data[start:start + length]
             
-            # Composite text over background
-            composite_clip = CompositeVideoClip([bg_clip, txt_clip]).with_duration(duration)
-            clips.append(composite_clip)
-            
-        except Exception as e:
-            logger.error(f"Error processing clip {i}: {e}")
-            raise
+            # Prefer the Windows (UTF-16) record, then the Macintosh (Roman) one
+            if 3 in names:
+                return names[3].decode("utf-16-be")
+            if 1 in names:
+                return names[1].decode("mac-roman")
+            return None
+    except (OSError, struct.error, UnicodeDecodeError):
+        return None
+    
+    return None
+
+
+def _render_with_ffmpeg(
+    data: List[Dict[str, any]],
+    final_video: str,
+    original_audio: str,
+    bg_path: str,
+    font_path: str,
+    fade_duration: float,
+    min_duration_for_fade: float,
+    font_size: int,
+    text_color: str,
+    fps: int
+) -> None:
+    """
+    Render the video in a single FFmpeg process.
+    
+    Captions are written as an ASS subtitle track (with \\fad for the fades)
+    and burned onto the looped background image by libass.
+    
+    Raises:
+        ValueError: If no caption could be placed
+        RuntimeError: If FFmpeg fails
+    """
+    from PIL import Image, ImageColor, ImageFont
+    
+    with Image.open(bg_path) as bg_image:
+        width, height = bg_image.size
+    font_name = _font_postscript_name(font_path) or ImageFont.truetype(font_path).getname()[0]
+    red, green, blue = ImageColor.getrgb(text_color)[:3]
+    
+    events = []
+    skipped_clips = 0
+    start = 0.0
+    
+    for i, item in enumerate(data, start=1):
+        caption_text = item.get("text", "").strip()
+        duration = item.get("duration_ms", 0) / 1000.0
+        
+        if duration <= 0:
+            logger.warning(f"Clip {i}/{len(data)}: Invalid duration - skipping")
+            skipped_clips += 1
+            continue
+        
+        # Keep the timeline in step with the audio even when a chunk has no text
+        if not caption_text:
+            logger.warning(f"Clip {i}/{len(data)}: Empty text - skipping")
+            skipped_clips += 1
+            start += duration
+            continue
+        
+        logger.info(f"Clip {i}/{len(data)}: {caption_text[:50]}{'...' if len(caption_text) > 50 else ''} (duration: {duration:.2f}s)")
+        
+        # Calculate appropriate fade duration (don't fade more than 1/3 of clip)
+        current_fade_duration = min(fade_duration, duration / 3) if duration > min_duration_for_fade else 0
+        fade_ms = round(current_fade_duration * 1000)
+        fade_tag = f"{{\\fad({fade_ms},{fade_ms})}}" if fade_ms > 0 else ""
+        
+        # ASS uses braces for override tags and \N, \n, \h as escapes; a word
+        # joiner after each backslash keeps literal ones from being parsed
+        ass_text = (
+            caption_text.replace("\\", "\\\u2060")
+            .replace("{", "(").replace("}", ")")
+            .replace("\n", "\\N")
+        )
+        events.append(
+            f"Dialogue: 0,{_ass_timestamp(start)},{_ass_timestamp(start + duration)},"
+            f"Default,,0,0,0,,{fade_tag}{ass_text}"
+        )
+        start += duration
     
-    if not clips:
+    if not events:
         raise ValueError(f"No valid clips generated. Skipped {skipped_clips} clips.")
     
     if skipped_clips > 0:
         logger.warning(f"Skipped {skipped_clips} invalid clips")
     
-    logger.info(f"Concatenating {len(clips)} video clips...")
+    subtitles = "\n".join([
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {width}",
+        f"PlayResY: {height}",
+        "WrapStyle: 0",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, "
+        "Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+        "Alignment, MarginL, MarginR, MarginV, Encoding",
+        f"Style: Default,{font_name},{font_size},&H00{blue:02X}{green:02X}{red:02X},&H000000FF,"
+        "&H00000000,&H00000000,0,0,0,0,100,100,0,0,1,0,0,5,40,40,40,1",
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        *events,
+        ""
+    ])
     
-    try:
-        # Concatenate all clips
-        final_video_clip = concatenate_videoclips(clips, method="compose")
+    logger.info(f"Rendering {len(events)} captions with FFmpeg...")
+    
+    # Run inside a scratch directory so the filter graph only sees relative
+    # paths, which avoids escaping drive letters and backslashes on Windows
+    with tempfile.TemporaryDirectory() as work_dir:
+        with open(os.path.join(work_dir, "captions.ass"), "w", encoding="utf-8") as f:
+            f.write(subtitles)
+        shutil.copy(font_path, os.path.join(work_dir, os.path.basename(font_path)))
+        
+        codec, codec_params = _select_video_encoder()
+        logger.info(f"Encoding with {codec}")
         
-        # Add original audio
-        logger.info("Adding audio track...")
-        audio = AudioFileClip(original_audio)
-        final_output = final_video_clip.with_audio(audio)
+        cmd = [
+            FFMPEG_BINARY, "-hide_banner", "-loglevel", "error", "-y",
+            "-loop", "1", "-framerate", str(fps), "-i", os.path.abspath(bg_path),
+            "-i", os.path.abspath(original_audio),
+            "-map", "0:v", "-map", "1:a",
+            "-vf", "ass=captions.ass:fontsdir=.,scale=trunc(iw/2)*2:trunc(ih/2)*2,format=yuv420p",
+            "-c:v", codec, *codec_params,
+            "-c:a", "aac",
+            # -shortest alone overshoots with a looped image input
+            "-t", f"{_probe_duration_ms(original_audio) / 1000:.3f}",
+            os.path.abspath(final_video)
+        ]
         
-        # Write final video
         logger.info(f"Writing video to: {final_video}")
-        final_output.write_videofile(final_video, fps=fps)
+        result = subprocess.run(cmd, cwd=work_dir, capture_output=True, text=True, encoding="utf-8", errors="replace")
+        if result.returncode != 0:
+            logger.error(f"Failed to generate video: {result.stderr.strip()}")
+            raise RuntimeError(f"ffmpeg rendering failed with code {result.returncode}")
+    
+    logger.info(f"✓ Video generated successfully: {final_video}")
+
+
+# Recitations repeat phrases (basmala, refrains), so identical captions are
+# drawn once and the read-only crop is shared between their clips
+@functools.lru_cache(maxsize=512)
+def _render_caption_rgba(
+    text: str,
+    font_path: str,
+    font_size: int,
+    color: str,
+    size: Tuple[int, int]
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Draw a caption centered on a transparent canvas, wrapping it to the width.
+    
+    Only the box around the drawn text is kept, so cached captions stay small.
+    
+    Args:
+        text: Caption text
+        font_path: Path to font file
+        font_size: Size of text font
+        color: Text color
+        size: Canvas (width, height)
+    
+    Returns:
+        Tuple of (RGBA array of the text box, (left, top) of the box on the canvas)
+    """
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFont
+    
+    font = ImageFont.truetype(font_path, font_size)
+    canvas = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(canvas)
+    
+    # Greedy word wrap, like MoviePy's "caption" method
+    lines = []
+    for paragraph in text.splitlines() or [""]:
+        line = ""
+        for word in paragraph.split():
+            candidate = f"{line} {word}" if line else word
+            if line and draw.textlength(candidate, font=font) > size[0]:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    
+    draw.multiline_text(
+        (size[0] / 2, size[1] / 2),
+        "\n".join(lines),
+        font=font,
+        fill=color,
+        anchor="mm",
+        align="center"
+    )
+    bbox = canvas.getbbox() or (0, 0, 0, 0)
+    return np.asarray(canvas.crop(bbox)), bbox[:2]
+
+
+def _fading_frame_function(
+    bg_array: np.ndarray,
+    caption: np.ndarray,
+    box: Tuple[int, int],
+    frame: np.ndarray,
+    duration: float,
+    fade_duration: float
+):
+    """
+    Build a MoviePy frame function that fades a caption frame in and out.
+    
+    Only the caption box changes during a fade, so each frame is the
+    background with that box blended in 8-bit fixed point (uint16
+    intermediates), never leaving uint8 for a float frame.
+    
+    Args:
+        bg_array: Background without the caption
+        caption: Caption box of the frame (background with the caption blended in)
+        box: (left, top) of the caption box on the frame
+        frame: Full frame with the caption, returned when fully visible
+        duration: Clip duration in seconds
+        fade_duration: Length of each fade in seconds
+    
+    Returns:
+        Function mapping a time in seconds to an RGB frame
+    """
+    import numpy as np
+    
+    left, top = box
+    height, width = caption.shape[:2]
+    bg_region = bg_array[top:top + height, left:left + width].astype(np.uint16)
+    caption = caption.astype(np.uint16)
+    
+    def frame_function(t: float) -> np.ndarray:
+        opacity = min(1.0, t / fade_duration, (duration - t) / fade_duration)
+        if opacity >= 1.0:
+            return frame
+        weight = int(max(opacity, 0.0) * 256)
+        out = bg_array.copy()
+        out[top:top + height, left:left + width] = (bg_region * (256 - weight) + caption * weight) >> 8
+        return out
+    
+    return frame_function
+
+
+def _render_with_moviepy(
+    data: List[Dict[str, any]],
+    final_video: str,
+    original_audio: str,
+    bg_path: str,
+    font_path: str,
+    fade_duration: float,
+    min_duration_for_fade: float,
+    font_size: int,
+    text_color: str,
+    fps: int
+) -> None:
+    """
+    Render the video with MoviePy, for FFmpeg builds without libass.
+    
+    Each caption is drawn and blended onto the background once, so every
+    clip is a single image (or a fading frame function) rather than a
+    composite of a background and a text clip. Clips are rendered in groups
+    of MOVIEPY_CLIPS_PER_PART to silent part files, which FFmpeg then joins
+    without re-encoding, so memory does not grow with the number of clips.
+    
+    Raises:
+        ValueError: If no valid clip could be generated
+    """
+    import numpy as np
+    from PIL import Image
+    from moviepy import ImageClip, VideoClip, concatenate_videoclips
+    from moviepy.config import FFMPEG_BINARY as MOVIEPY_FFMPEG_BINARY
+    
+    # Decode the background once; every caption frame is blended onto it
+    with Image.open(bg_path) as bg_image:
+        bg_array = np.asarray(bg_image.convert("RGB"))
+    bg_size = (bg_array.shape[1], bg_array.shape[0])
+    
+    codec, codec_params = _select_video_encoder(MOVIEPY_FFMPEG_BINARY)
+    if codec == "libx264":
+        # Frames come from Python, so favour encoding speed over size; the
+        # background is static, which the stillimage tune is made for
+        write_options = dict(
+            preset="ultrafast",
+            threads=os.cpu_count(),
+            ffmpeg_params=["-tune", "stillimage", "-crf", "28"]
+        )
+    else:
+        write_options = dict(ffmpeg_params=codec_params)
+    logger.info(f"Encoding with {codec}")
+    
+    skipped_clips = 0
+    group = []
+    part_names = []
+    
+    # Parts are written next to the output so the final concat stays on one disk
+    with tempfile.TemporaryDirectory(
+        prefix=".parts_", dir=os.path.dirname(os.path.abspath(final_video))
+    ) as parts_dir:
         
-        logger.info(f"✓ Video generated successfully: {final_video}")
+        def write_part() -> None:
+            """Render the current group of clips to a silent part file and release it."""
+            part_name = f"part_{len(part_names)}.mp4"
+            logger.info(f"Writing part {len(part_names) + 1} ({len(group)} clips)...")
+            
+            # All clips share the background size, so plain chaining is enough
+            part_clip = concatenate_videoclips(group)
+            part_clip.write_videofile(
+                os.path.join(parts_dir, part_name),
+                fps=fps,
+                codec=codec,
+                audio=False,
+                **write_options
+            )
+            part_clip.close()
+            
+            part_names.append(part_name)
+            group.clear()
+            gc.collect()
         
-        # Clean up resources
-        final_video_clip.close()
-        audio.close()
+        for i, item in enumerate(data, start=1):
+            try:
+                caption_text = item.get("text", "").strip()
+                duration = item.get("duration_ms", 0) / 1000.0
+                
+                if duration <= 0:
+                    logger.warning(f"Clip {i}/{len(data)}: Invalid duration - skipping")
+                    skipped_clips += 1
+                    continue
+                
+                # Keep the timeline in step with the audio even when a chunk has no text
+                if not caption_text:
+                    logger.warning(f"Clip {i}/{len(data)}: Empty text - skipping")
+                    skipped_clips += 1
+                    group.append(ImageClip(bg_array).with_duration(duration))
+                    if len(group) == MOVIEPY_CLIPS_PER_PART:
+                        write_part()
+                    continue
+                
+                logger.info(f"Clip {i}/{len(data)}: {caption_text[:50]}{'...' if len(caption_text) > 50 else ''} (duration: {duration:.2f}s)")
+                
+                # Calculate appropriate fade duration (don't fade more than 1/3 of clip)
+                current_fade_duration = min(fade_duration, duration / 3) if duration > min_duration_for_fade else 0
+                
+                # Blend the static caption onto the background once instead of
+                # compositing two clips on every frame
+                text_rgba, (left, top) = _render_caption_rgba(caption_text, font_path, font_size, text_color, bg_size)
+                height, width = text_rgba.shape[:2]
+                frame = bg_array.copy()
+                region = frame[top:top + height, left:left + width]
+                alpha = text_rgba[..., 3:].astype(np.uint16)
+                region[:] = (region * (255 - alpha) + text_rgba[..., :3] * alpha + 127) // 255
+                
+                if current_fade_duration > 0:
+                    clip = VideoClip(
+                        _fading_frame_function(bg_array, region, (left, top), frame, duration, current_fade_duration),
+                        duration=duration
+                    )
+                else:
+                    clip = ImageClip(frame).with_duration(duration)
+                group.append(clip)
+                
+                if len(group) == MOVIEPY_CLIPS_PER_PART:
+                    write_part()
+                
+            except Exception as e:
+                logger.error(f"Error processing clip {i}: {e}")
+                raise
         
-    except Exception as e:
-        logger.error(f"Failed to generate video: {e}")
-        raise
+        if group:
+            write_part()
+        
+        if skipped_clips == len(data):
+            raise ValueError(f"No valid clips generated. Skipped {skipped_clips} clips.")
+        
+        if skipped_clips > 0:
+            logger.warning(f"Skipped {skipped_clips} invalid clips")
+        
+        # Join the parts without re-encoding and add the original audio
+        logger.info(f"Joining {len(part_names)} parts and adding audio track...")
+        with open(os.path.join(parts_dir, "parts.txt"), "w", encoding="utf-8") as f:
+            f.writelines(f"file '{name}'\n" for name in part_names)
+        
+        cmd = [
+            MOVIEPY_FFMPEG_BINARY, "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "concat", "-safe", "0", "-i", "parts.txt",
+            "-i", os.path.abspath(original_audio),
+            "-map", "0:v", "-map", "1:a",
+            "-c:v", "copy",
+            "-c:a", "aac",
+            "-shortest",
+            os.path.abspath(final_video)
+        ]
+        
+        logger.info(f"Writing video to: {final_video}")
+        result = subprocess.run(cmd, cwd=parts_dir, capture_output=True, text=True, encoding="utf-8", errors="replace")
+        if result.returncode != 0:
+            logger.error(f"Failed to generate video: {result.stderr.strip()}")
+            raise RuntimeError(f"ffmpeg concat failed with code {result.returncode}")
     
-    return final_video
+    logger.info(f"✓ Video generated successfully: {final_video}")
+
 
 def convert_to_mp3(audio_path: str, output_dir: str) -> str:
     """
@@ -419,6 +1539,8 @@ def convert_to_mp3(audio_path: str, output_dir: str) -> str:
     Returns:
         Path to the converted MP3 file
     """
+    from pydub import AudioSegment
+    
     audio_path = Path(audio_path)
     
     # If already MP3, return as is
@@ -444,6 +1566,100 @@ def convert_to_mp3(audio_path: str, output_dir: str) -> str:
     
     return str(mp3_path)
 
+async def _run_audio_stages(
+    audio_path: str,
+    output_dir: str,
+    api_url: Optional[str],
+    workers: int = 8,
+    timeout: int = 60,
+    max_rps: float = 5.0
+) -> Tuple[List[Dict[str, any]], List[Dict[str, any]], str]:
+    """
+    Split, transcribe and convert the input audio as concurrent stages.
+    
+    A producer thread pushes every chunk onto a queue as soon as it is
+    written, transcription workers consume it while splitting continues, and
+    a collector restores chunk order. MP3 conversion of the source runs
+    alongside both.
+    
+    Args:
+        audio_path: Path to input audio file
+        output_dir: Directory for intermediate files
+        api_url: Transcription API endpoint; chunks are only split when omitted
+        workers: Number of concurrent transcription requests (default: 8)
+        timeout: Request timeout in seconds (default: 60)
+        max_rps: Maximum number of requests started per second (default: 5.0)
+    
+    Returns:
+        Tuple of (chunk metadata, ordered transcriptions, MP3 audio path)
+    """
+    loop = asyncio.get_running_loop()
+    chunk_queue: asyncio.Queue = asyncio.Queue()
+    result_queue: asyncio.Queue = asyncio.Queue()
+    chunks = []
+    worker_count = workers if api_url else 0
+    session = _create_session(pool_size=max(worker_count, 1))
+    rate_limiter = _RateLimiter(max_rps)
+    # The producer and the MP3 conversion each hold a thread for the whole
+    # split, so they get their own on top of one per transcription worker
+    executor = ThreadPoolExecutor(max_workers=worker_count + 2)
+    
+    def produce() -> None:
+        try:
+            for path, duration_ms in iter_split_audio(audio_path, output_dir):
+                chunks.append({"file": path, "duration_ms": duration_ms})
+                if api_url:
+                    loop.call_soon_threadsafe(chunk_queue.put_nowait, (len(chunks) - 1, path, duration_ms))
+        finally:
+            for _ in range(worker_count):
+                loop.call_soon_threadsafe(chunk_queue.put_nowait, None)
+    
+    async def transcribe_worker() -> None:
+        while (item := await chunk_queue.get()) is not None:
+            index, path, duration_ms = item
+            entry = await loop.run_in_executor(
+                executor, _transcribe_file, session, api_url, path, timeout, duration_ms, rate_limiter
+            )
+            await result_queue.put((index, entry))
+    
+    async def collect() -> List[Dict[str, any]]:
+        transcriptions = []
+        pending = {}
+        while (item := await result_queue.get()) is not None:
+            index, entry = item
+            pending[index] = entry
+            while len(transcriptions) in pending:
+                transcriptions.append(pending.pop(len(transcriptions)))
+        return transcriptions
+    
+    collector = asyncio.create_task(collect())
+    try:
+        _, audio_path, *_ = await asyncio.gather(
+            loop.run_in_executor(executor, produce),
+            loop.run_in_executor(executor, convert_to_mp3, audio_path, CONVERSION_DIR),
+            *(transcribe_worker() for _ in range(worker_count))
+        )
+    finally:
+        await result_queue.put(None)
+        executor.shutdown(wait=False)
+        session.close()
+    transcriptions = await collector
+    
+    if not chunks:
+        logger.warning("No chunks were created. Audio may be too short or has no silence.")
+    
+    try:
+        _save_json(os.path.join(output_dir, "chunks.json"), chunks)
+        if api_url:
+            _save_json(os.path.join(output_dir, "transcriptions.json"), transcriptions)
+        logger.info(f"✓ Saved metadata for {len(chunks)} chunks to {output_dir}/")
+    except IOError as e:
+        logger.error(f"Failed to save metadata: {e}")
+        raise
+    
+    return chunks, transcriptions, audio_path
+
+
 def process_full_pipeline(
     audio_path: str,
     output_video: str = str(DEFAULT_OUTPUT_VIDEO),
@@ -455,6 +1671,9 @@ def process_full_pipeline(
     """
     Run the complete pipeline: split → transcribe → generate video.
     
+    Splitting and transcription overlap: each chunk is sent to the API as
+    soon as it has been written.
+    
     Args:
         audio_path: Path to input audio file
         output_video: Path for output video file
@@ -476,21 +1695,18 @@ def process_full_pipeline(
     }
     
     try:
-        # Step 1: Split audio
-        logger.info("\n[STEP 1/3] Splitting audio...")
-        chunks = split_audio(audio_path, output_dir)
+        # Steps 1-2: Split and transcribe as overlapping stages
+        if api_url:
+            logger.info("\n[STEP 1-2/3] Splitting and transcribing audio...")
+        else:
+            logger.info("\n[STEP 1/3] Splitting audio...")
+        chunks, transcriptions, audio_path = asyncio.run(
+            _run_audio_stages(audio_path, output_dir, api_url)
+        )
         results["chunks_count"] = len(chunks)
         results["chunks_dir"] = output_dir
         
-        audio_path = convert_to_mp3(audio_path=audio_path, output_dir=CONVERSION_DIR)
-        # Step 2: Transcribe (only if API URL provided)
         if api_url:
-            logger.info("\n[STEP 2/3] Transcribing audio chunks...")
-            transcriptions = transcribe_chunks(
-                api_url,
-                output_dir,
-                os.path.join(output_dir, "transcriptions.json")
-            )
             results["transcriptions_count"] = len(transcriptions)
         else:
             logger.warning("\n[STEP 2/3] Skipping transcription (no API URL provided)")